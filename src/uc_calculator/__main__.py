@@ -0,0 +1,6 @@
+# src/uc_calculator/__main__.py
+import sys
+
+from uc_calculator.cli import main
+
+sys.exit(main())
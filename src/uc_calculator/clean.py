@@ -6,6 +6,7 @@ TODO
 - Data on tenure from household table?
 - Why are there so many missing rent observations?
 - Data on childcare costs (childcare)
+- Flag adults under 25 in merge_frs
 """
 from pathlib import Path
 
@@ -49,31 +50,97 @@ ADULT_RENAME = {
 ADULT_RENAME.update(COMMON_RENAME)
 
 
-def prepare_frs_data():
-    frs_raw = import_frs()
-    frs_clean = clean_frs(frs_raw)
-    # frs_merge = merge_frs(frs_clean)
-    # frs_canonical = generate_features_frs(frs_merge)
+DATA_DIR = Path("data")
+INTERIM_TABLES = ["adult", "bu"]
+
+
+def prepare_frs_data(data_dir: Path = DATA_DIR) -> dict:
+    frs_raw = import_frs(data_dir)
+    frs_clean = clean_frs(frs_raw, data_dir / "interim")
     return frs_clean
 
 
-def import_frs():
+def load_frs_data(data_dir: Path = DATA_DIR, force: bool = False) -> dict:
+    """Load cleaned FRS tables, reusing interim artifacts where available
+
+    Parameters
+    ----------
+    data_dir : Path
+        Directory containing "raw" and "interim" subdirectories.
+    force : bool
+        Re-import the raw SPSS files even if interim artifacts exist.
+
+    Returns
+    -------
+    dict
+        Cleaned FRS tables keyed by table name.
+    """
+    interim_paths = {
+        table: data_dir / "interim" / f"{table}.parquet" for table in INTERIM_TABLES
+    }
+    if force or not all(path.exists() for path in interim_paths.values()):
+        return prepare_frs_data(data_dir)
+    return {table: pd.read_parquet(path) for table, path in interim_paths.items()}
+
+
+def import_frs(data_dir: Path = DATA_DIR) -> dict:
     raw_table_names = ["adult", "benunit", "chldcare"]
     keys = ["adult", "bu", "childcare"]
-    return {
-        key: pd.read_spss(Path(f"data/raw/{table}.sav"))
-        for key, table in zip(keys, raw_table_names)
-    }
+    raw_paths = [data_dir / "raw" / f"{table}.sav" for table in raw_table_names]
+    for path in raw_paths:
+        if not path.exists():
+            raise FileNotFoundError(f"FRS raw data file not found: {path}")
+    return {key: pd.read_spss(path) for key, path in zip(keys, raw_paths)}
 
 
-def clean_frs(frs_raw):
-    adult = clean_adult(frs_raw["adult"])
-    bu = clean_bu(frs_raw["bu"])
+def clean_frs(frs_raw: dict, interim_dir: Path = DATA_DIR / "interim") -> dict:
+    interim_dir.mkdir(parents=True, exist_ok=True)
+    adult = clean_adult(frs_raw["adult"], interim_dir)
+    bu = clean_bu(frs_raw["bu"], interim_dir)
     # childcare = clean_childcare(childcare_raw)
     return {"adult": adult, "bu": bu}
 
 
-def clean_adult(adult_raw: pd.DataFrame) -> pd.DataFrame:
+def merge_frs(frs_clean: dict) -> pd.DataFrame:
+    """Merge cleaned FRS tables into a DataFrame of BUs for the UC calculator
+
+    Adults are not yet split by age and childcare costs are not yet cleaned,
+    so all adults are treated as 25 or over and childcare costs as zero.
+    Missing rent is also set to zero, so those BUs receive no housing element
+    and the disregard for BUs without housing costs. BUs with no adults in the
+    adult table get zero income.
+
+    Parameters
+    ----------
+    frs_clean : dict
+        Cleaned FRS tables keyed by table name.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame of BUs with the columns required by ``generate_uc_df``.
+    """
+    bu_income = (
+        frs_clean["adult"]
+        .groupby(["id_hh", "id_bu"])["post_tax_income"]
+        .sum()
+        .rename("post_tax_hh_income")
+    )
+    return (
+        frs_clean["bu"]
+        .join(bu_income, how="left")
+        .assign(
+            post_tax_hh_income=lambda x: x["post_tax_hh_income"].fillna(0.0),
+            rent=lambda x: x["rent"].fillna(0.0),
+            adults_under_25=False,
+            childcare_costs=0.0,
+        )
+    )
+
+
+def clean_adult(
+    adult_raw: pd.DataFrame, interim_dir: Path = DATA_DIR / "interim"
+) -> pd.DataFrame:
     adult = (
         adult_raw.filter(ADULT_RENAME)
         .rename(ADULT_RENAME, axis=1)
@@ -85,11 +152,13 @@ def clean_adult(adult_raw: pd.DataFrame) -> pd.DataFrame:
         )
         .loc[:, ["post_tax_income"]]
     )
-    adult.to_parquet(Path("data/interim/adult.parquet"))
+    adult.to_parquet(interim_dir / "adult.parquet")
     return adult
 
 
-def clean_bu(bu_raw: pd.DataFrame) -> pd.DataFrame:
+def clean_bu(
+    bu_raw: pd.DataFrame, interim_dir: Path = DATA_DIR / "interim"
+) -> pd.DataFrame:
     family_types_to_drop = ["Pensioner couple", "Pensioner single"]
     clean_columns_to_keep = ["couple", "rent", "num_kids", "num_adults"]
     bu = (
@@ -108,7 +177,7 @@ def clean_bu(bu_raw: pd.DataFrame) -> pd.DataFrame:
             clean_columns_to_keep,
         ]
     )
-    bu.to_parquet(Path("data/interim/bu.parquet"))
+    bu.to_parquet(interim_dir / "bu.parquet")
     return bu
 
 
@@ -0,0 +1,231 @@
+# src/uc_calculator/cli.py
+"""Command-line runner for preparing FRS data and running UC scenarios
+
+Heavy dependencies (pandas, numpy) are only imported inside the command that
+needs them, so ``uc-calculator --help`` and argument errors return quickly
+and batch jobs only pay for the imports they use.
+
+Scenario parameter files are JSON objects mapping parameter names to values,
+as consumed by ``uc_funcs.generate_uc_df``.
+"""
+import argparse
+import json
+from pathlib import Path
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+SUMMARY_COLUMNS = ["full_allowance", "capped_deduction", "uc_receipt"]
+PARAMETER_NAMES = frozenset(
+    [
+        "standard_single_over_25",
+        "standard_single_under_25",
+        "standard_couple_over_25",
+        "standard_couple_under_25",
+        "child_first",
+        "child_second",
+        "childcare_max_one",
+        "childcare_max_two",
+        "childcare_prop",
+        "taper",
+        "disregard_kids_no_housing",
+        "disregard_kids_with_housing",
+    ]
+)
+# merge_frs treats all adults as 25 or over and childcare costs as zero, so
+# changing these parameters has no effect on the FRS sample
+UNVARIED_PARAMETER_NAMES = frozenset(
+    [
+        "standard_single_under_25",
+        "standard_couple_under_25",
+        "childcare_max_one",
+        "childcare_max_two",
+        "childcare_prop",
+    ]
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"{parser.prog} {args.command}: error: {error}\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the command-line runner
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Parser with prepare, run, compare and summarise subcommands.
+    """
+    parser = argparse.ArgumentParser(
+        prog="uc-calculator", description=__doc__.splitlines()[0]
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--data-dir",
+        type=Path,
+        default=Path("data"),
+        help="directory containing raw and interim data (default: data)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prepare = subparsers.add_parser(
+        "prepare", parents=[common], help="import and clean FRS data"
+    )
+    prepare.add_argument(
+        "--force", action="store_true", help="rebuild existing interim artifacts"
+    )
+    prepare.set_defaults(func=_prepare)
+
+    run = subparsers.add_parser(
+        "run", parents=[common], help="calculate UC for a scenario"
+    )
+    run.add_argument("params", type=Path, help="scenario parameter file (JSON)")
+    run.add_argument(
+        "--output",
+        type=Path,
+        help="output file (default: <data-dir>/processed/<name>.parquet)",
+    )
+    run.set_defaults(func=_run)
+
+    compare = subparsers.add_parser(
+        "compare",
+        parents=[common],
+        help="compare two scenarios",
+        description=(
+            "Compare two scenarios by unweighted sums over the FRS sample. "
+            "Grossing factors are not applied, so totals are not costs. "
+            "All adults are treated as 25 or over and childcare costs as zero, "
+            "so under-25 standard allowances and childcare parameters have no "
+            "effect."
+        ),
+    )
+    compare.add_argument("base", type=Path, help="base scenario parameter file")
+    compare.add_argument("reform", type=Path, help="reform scenario parameter file")
+    compare.set_defaults(func=_compare)
+
+    summarise = subparsers.add_parser("summarise", help="summarise a scenario run")
+    summarise.add_argument("results", type=Path, help="output file from run")
+    summarise.set_defaults(func=_summarise)
+    return parser
+
+
+def load_params(path: Path) -> dict:
+    """Load scenario parameters from a JSON file
+
+    Parameters
+    ----------
+    path : Path
+        Path to a JSON object mapping each name in ``PARAMETER_NAMES`` to a
+        numeric value.
+
+    Returns
+    -------
+    dict
+        Universal Credit parameters.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a JSON object, has missing or unknown parameters,
+        or has non-numeric values.
+    """
+    with open(path) as params_file:
+        params = json.load(params_file)
+    if not isinstance(params, dict):
+        raise ValueError(f"{path} must contain a JSON object of parameters")
+    missing = sorted(PARAMETER_NAMES - params.keys())
+    unknown = sorted(params.keys() - PARAMETER_NAMES)
+    non_numeric = sorted(
+        name
+        for name, value in params.items()
+        if isinstance(value, bool) or not isinstance(value, (int, float))
+    )
+    for problem, names in [
+        ("missing", missing),
+        ("unknown", unknown),
+        ("non-numeric", non_numeric),
+    ]:
+        if names:
+            raise ValueError(f"{path} has {problem} parameters: {', '.join(names)}")
+    return params
+
+
+def _load_model_data(data_dir: Path) -> "pd.DataFrame":
+    from uc_calculator.clean import load_frs_data, merge_frs
+
+    return merge_frs(load_frs_data(data_dir))
+
+
+def _prepare(args: argparse.Namespace) -> int:
+    from uc_calculator.clean import load_frs_data
+
+    frs_clean = load_frs_data(args.data_dir, force=args.force)
+    for table, df in frs_clean.items():
+        print(f"{table}: {df.shape[0]} rows")
+    return 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    from uc_calculator.uc_funcs import generate_uc_df
+
+    params = load_params(args.params)
+    uc_df = generate_uc_df(_load_model_data(args.data_dir), params)
+    output = args.output or args.data_dir / "processed" / f"{args.params.stem}.parquet"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    uc_df.to_parquet(output)
+    print(output)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    import pandas as pd
+
+    from uc_calculator.uc_funcs import generate_uc_df
+
+    base_params, reform_params = load_params(args.base), load_params(args.reform)
+    changed = {
+        name for name in PARAMETER_NAMES if base_params[name] != reform_params[name]
+    }
+    if changed and changed <= UNVARIED_PARAMETER_NAMES:
+        print(
+            "warning: scenarios differ only in parameters the FRS data cannot "
+            f"vary ({', '.join(sorted(changed))}); the change will be zero",
+            file=sys.stderr,
+        )
+    data = _load_model_data(args.data_dir)
+    base, reform = [
+        generate_uc_df(data, params)[SUMMARY_COLUMNS]
+        for params in [base_params, reform_params]
+    ]
+    comparison = pd.DataFrame(
+        {
+            "base_unweighted_sum": base.sum(),
+            "reform_unweighted_sum": reform.sum(),
+            "change_unweighted_sum": (reform - base).sum(),
+        }
+    )
+    print(comparison.to_string())
+    return 0
+
+
+def _summarise(args: argparse.Namespace) -> int:
+    import pandas as pd
+
+    uc_df = pd.read_parquet(args.results, columns=SUMMARY_COLUMNS)
+    summary = uc_df.agg(["count", "mean", "sum"]).T.assign(
+        share_positive=(uc_df > 0.0).mean()
+    )
+    print(summary.to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
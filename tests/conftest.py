@@ -0,0 +1,29 @@
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(name="data_dir")
+def fixture_data_dir(tmp_path):
+    interim_dir = tmp_path / "interim"
+    interim_dir.mkdir()
+    pd.DataFrame(
+        {
+            "id_hh": [1, 1, 2],
+            "id_bu": [1, 1, 1],
+            "id_person": [1, 2, 1],
+            "post_tax_income": [500.0, 250.0, 0.0],
+        }
+    ).set_index(["id_hh", "id_bu", "id_person"]).to_parquet(
+        interim_dir / "adult.parquet"
+    )
+    pd.DataFrame(
+        {
+            "id_hh": [1, 2],
+            "id_bu": [1, 1],
+            "couple": [True, False],
+            "rent": [400.0, 0.0],
+            "num_kids": [2, 0],
+            "num_adults": [2, 1],
+        }
+    ).set_index(["id_hh", "id_bu"]).to_parquet(interim_dir / "bu.parquet")
+    return tmp_path
@@ -0,0 +1,60 @@
+"""Tests for loading and merging cleaned FRS data"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from uc_calculator.clean import load_frs_data, merge_frs
+
+
+@pytest.fixture(name="frs_clean")
+def fixture_frs_clean(data_dir):
+    frs_clean = load_frs_data(data_dir)
+    no_adult_bu = pd.DataFrame(
+        {"couple": [False], "rent": [np.nan], "num_kids": [1], "num_adults": [1]},
+        index=pd.MultiIndex.from_tuples([(3, 1)], names=["id_hh", "id_bu"]),
+    )
+    frs_clean["bu"] = pd.concat([frs_clean["bu"], no_adult_bu])
+    return frs_clean
+
+
+class TestMergeFRS:
+    def test_income_summed_by_bu(self, frs_clean):
+        merged = merge_frs(frs_clean)
+        assert merged.loc[(1, 1), "post_tax_hh_income"] == 750.0
+        assert merged.loc[(2, 1), "post_tax_hh_income"] == 0.0
+
+    def test_bu_without_adults(self, frs_clean):
+        merged = merge_frs(frs_clean)
+        assert merged.loc[(3, 1), "post_tax_hh_income"] == 0.0
+
+    def test_missing_rent_zero(self, frs_clean):
+        merged = merge_frs(frs_clean)
+        assert merged.loc[(3, 1), "rent"] == 0.0
+
+    def test_default_columns(self, frs_clean):
+        merged = merge_frs(frs_clean)
+        assert merged.shape[0] == 3
+        assert not merged["adults_under_25"].any()
+        assert all(merged["childcare_costs"] == 0.0)
+
+
+class TestLoadFRSData:
+    @pytest.fixture(name="rebuild")
+    def fixture_rebuild(self, mocker):
+        mocker.patch("uc_calculator.clean.import_frs")
+        return mocker.patch("uc_calculator.clean.clean_frs")
+
+    def test_reads_interim(self, data_dir, rebuild):
+        frs_clean = load_frs_data(data_dir)
+        rebuild.assert_not_called()
+        assert frs_clean["bu"].shape[0] == 2
+        assert frs_clean["adult"].shape[0] == 3
+
+    def test_rebuilds_missing_interim(self, data_dir, rebuild):
+        (data_dir / "interim" / "adult.parquet").unlink()
+        assert load_frs_data(data_dir) is rebuild.return_value
+        rebuild.assert_called_once()
+
+    def test_force_rebuilds(self, data_dir, rebuild):
+        assert load_frs_data(data_dir, force=True) is rebuild.return_value
+        rebuild.assert_called_once()
@@ -0,0 +1,128 @@
+"""Tests for the command-line runner"""
+import json
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from uc_calculator.cli import load_params, main
+
+PARAMS = {
+    "standard_single_over_25": 334.91,
+    "standard_single_under_25": 265.31,
+    "standard_couple_over_25": 525.72,
+    "standard_couple_under_25": 416.45,
+    "child_first": 290.00,
+    "child_second": 244.58,
+    "childcare_max_one": 646.35,
+    "childcare_max_two": 1108.04,
+    "childcare_prop": 0.85,
+    "taper": 0.55,
+    "disregard_kids_no_housing": 573.0,
+    "disregard_kids_with_housing": 344.0,
+}
+
+
+@pytest.fixture(name="params_path")
+def fixture_params_path(tmp_path):
+    params_path = tmp_path / "baseline.json"
+    params_path.write_text(json.dumps(PARAMS))
+    return params_path
+
+
+def test_import_is_lazy():
+    code = "import sys, uc_calculator.cli; print('pandas' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert output.stdout.strip() == "False"
+
+
+class TestLoadParams:
+    def test_valid(self, params_path):
+        assert load_params(params_path) == PARAMS
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            [1, 2],
+            {"taper": 0.5},
+            dict(PARAMS, tapper=0.5),
+            dict(PARAMS, taper="0.5"),
+            dict(PARAMS, taper=True),
+        ],
+    )
+    def test_invalid(self, params, tmp_path):
+        params_path = tmp_path / "params.json"
+        params_path.write_text(json.dumps(params))
+        with pytest.raises(ValueError):
+            load_params(params_path)
+
+
+class TestErrors:
+    def test_invalid_params_before_loading_data(self, tmp_path, mocker, capsys):
+        load_model_data = mocker.patch("uc_calculator.cli._load_model_data")
+        params_path = tmp_path / "params.json"
+        params_path.write_text(json.dumps({"taper": 0.5}))
+        with pytest.raises(SystemExit) as exit_info:
+            main(["run", str(params_path)])
+        assert exit_info.value.code == 1
+        load_model_data.assert_not_called()
+        assert "missing parameters" in capsys.readouterr().err
+
+    def test_prepare_without_raw_data(self, tmp_path, capsys):
+        with pytest.raises(SystemExit) as exit_info:
+            main(["prepare", "--data-dir", str(tmp_path)])
+        assert exit_info.value.code == 1
+        assert "adult.sav" in capsys.readouterr().err
+
+    def test_missing_file(self, tmp_path, capsys):
+        with pytest.raises(SystemExit) as exit_info:
+            main(["summarise", str(tmp_path / "missing.parquet")])
+        assert exit_info.value.code == 1
+        assert "error" in capsys.readouterr().err
+
+
+def test_prepare_reuses_interim(data_dir, capsys):
+    assert main(["prepare", "--data-dir", str(data_dir)]) == 0
+    assert "bu: 2 rows" in capsys.readouterr().out
+
+
+def test_run_writes_results(data_dir, params_path):
+    main(["run", str(params_path), "--data-dir", str(data_dir)])
+    uc_df = pd.read_parquet(data_dir / "processed" / "baseline.parquet")
+    assert uc_df.shape[0] == 2
+    assert uc_df.loc[(1, 1), "uc_receipt"] == pytest.approx(1237.0)
+
+
+def test_summarise(data_dir, params_path, capsys):
+    main(["run", str(params_path), "--data-dir", str(data_dir)])
+    results = data_dir / "processed" / "baseline.parquet"
+    assert main(["summarise", str(results)]) == 0
+    assert "uc_receipt" in capsys.readouterr().out
+
+
+def test_compare_higher_taper(data_dir, params_path, capsys):
+    reform_path = params_path.with_name("reform.json")
+    reform_path.write_text(json.dumps(dict(PARAMS, taper=0.65)))
+    main(["compare", str(params_path), str(reform_path), "--data-dir", str(data_dir)])
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert "change_unweighted_sum" in captured.out
+    uc_change = captured.out.splitlines()[-1].split()
+    assert uc_change[0] == "uc_receipt"
+    assert float(uc_change[-1]) == pytest.approx(-40.6)
+
+
+def test_compare_warns_on_unvaried_parameters(data_dir, params_path, capsys):
+    reform_path = params_path.with_name("reform.json")
+    reform_path.write_text(json.dumps(dict(PARAMS, childcare_prop=0.5)))
+    main(["compare", str(params_path), str(reform_path), "--data-dir", str(data_dir)])
+    assert "childcare_prop" in capsys.readouterr().err
+
+
+def test_summarise_rejects_data_dir(tmp_path):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["summarise", "results.parquet", "--data-dir", str(tmp_path)])
+    assert exit_info.value.code == 2